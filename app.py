@@ -1,4 +1,5 @@
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+import logging
 import os
 import uvicorn
 import asyncio
@@ -6,6 +7,8 @@ from dotenv import load_dotenv
 
 assert load_dotenv(override=True)
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
 from src import slack_app, get_api
 
 
@@ -1,9 +1,14 @@
 from src.apis import init_routes
 from src.listeners import register_listeners
+from src.services.domo import domo_session
+from src.services.routes.slack import close_slack_client
+from src.utils.pydantic_agent_generator import openai_http_client
 
+import contextlib
 import os
 from slack_bolt.async_app import AsyncApp as AsyncSlackApp
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 slack_app = AsyncSlackApp(token=os.environ.get("SLACK_BOT_TOKEN"), signing_secret=os.environ.get("SLACK_SIGNING_SECRET"))
 
@@ -18,8 +23,18 @@ def get_slack_app() -> AsyncSlackApp:
     return slack_app
 
 
+@contextlib.asynccontextmanager
+async def lifespan(api: FastAPI):
+    yield
+
+    # the shared OpenAI, Slack and Domo clients own pooled sessions, close them on the loop that opened them
+    await openai_http_client.aclose()
+    await close_slack_client()
+    await domo_session.aclose()
+
+
 # Initialize `api` lazily to avoid circular import
 def get_api():
-    api = FastAPI()
+    api = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
     api.include_router(init_routes())
     return api
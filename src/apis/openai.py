@@ -1,19 +1,32 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+import functools
 
-from utils.pydantic_agent_generator import generate_pydantic_agent, generate_agent_dependencies, generate_model
+from src.utils.pydantic_agent_generator import (
+    generate_pydantic_agent,
+    get_agent_dependencies,
+    get_model,
+    PydanticAIDependencies,
+)
 
 # Initialize router
 router = APIRouter(prefix="/ai", tags=["ai"])
 
-openai_agent = generate_pydantic_agent(system_prompt="You are a helpful AI assistant for OpenAI API requests.")
-openai_model = generate_model()
-agent_deps = generate_agent_dependencies()
+
+@functools.cache
+def get_openai_agent():
+    """Builds the API agent on first use rather than at import."""
+    return generate_pydantic_agent(system_prompt="You are a helpful AI assistant for OpenAI API requests.")
+
+
+def get_agent_deps() -> PydanticAIDependencies:
+    """Provides the shared agent dependencies so they can be swapped without re-importing the module."""
+    return get_agent_dependencies()
 
 
 @router.post("/call_openai_chat_completion")
-async def call_openai_chat_completion(messages: list):
+async def call_openai_chat_completion(messages: list, deps: PydanticAIDependencies = Depends(get_agent_deps)):
     """
     Implements an OpenAI chatbot for handling app messages.
     """
 
-    return await openai_agent.run(user_prompt=messages, model=openai_model, deps=agent_deps)
+    return await get_openai_agent().run(user_prompt=messages, model=get_model(), deps=deps)
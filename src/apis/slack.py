@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from services.routes.slack.auth import validate_bot_auth
+from src.services.routes.slack.auth import validate_bot_auth
 
 router = APIRouter(prefix="/slack", tags=["slack"])
 
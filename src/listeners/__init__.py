@@ -4,9 +4,12 @@
 from src.listeners import commands
 from src.listeners import events
 from src.listeners import messages
+from src.listeners.middleware import use_shared_slack_client
 
 
 def register_listeners(app):
+    app.middleware(use_shared_slack_client)
+
     # actions.register(app)
     # shortcuts.register(app)
     # views.register(app)
@@ -2,8 +2,10 @@ from src.utils.ValidationError import ValidationError
 import src.services.routes.slack.channel as slack_routes  # Fix import for Slack utilities
 
 from slack_bolt.async_app import AsyncAck, AsyncSay
+import asyncio
 import logging
-import json
+import orjson
+import re
 from typing import Tuple
 
 from src.services.openai_agent import summarize_chat_messages
@@ -11,28 +13,23 @@ from src.services.openai_agent import summarize_chat_messages
 
 logger = logging.getLogger(__name__)
 
+_BACKUP_COMMAND_RE = re.compile(r"^\s*#?(?P<channel_name>[\w.-]+)\s+(?P<days>\d+)\s*$")
+
 
 async def validate_backup_history_command(client, command: str) -> Tuple[str, str, int]:
     """retrieves channel_id and days to extract from comman"""
 
-    channel_id, channel_name, days = None, None, None
-
-    parts = command.split()
+    match = _BACKUP_COMMAND_RE.match(command)
 
     # Validate command format
-    if len(parts) < 2:
+    if not match:
         raise ValidationError("Invalid command format. Use: /backup #channel_name days")
 
-    channel_name = parts[0].lstrip("#")
-    try:
-        days = int(parts[1])
-        if days <= 0 or days > 30:
-            raise ValidationError("Please specify a number of days between 1 and 30.")
-    except ValueError as e:  # Correctly reference the exception variable
-        raise ValidationError("Invalid number of days. Please specify a number between 1 and 30.") from e
+    channel_name = match["channel_name"]
+    days = int(match["days"])
 
-    if not channel_name or not days:
-        raise ValidationError("Invalid command format. Use: /backup #channel_name days")
+    if days <= 0 or days > 30:
+        raise ValidationError("Please specify a number of days between 1 and 30.")
 
     channel_id = await slack_routes.search_channel_by_name(client, channel_name)
 
@@ -46,7 +43,8 @@ async def backup_command_callback(command, ack: AsyncAck, respond, say: AsyncSay
 
     await ack()
 
-    logger.info(command)
+    logger.debug("slash command: %s", command)
+    logger.info("cmd user=%s channel=%s", command.get("user_id"), command.get("channel_id"))
 
     user_id = command["user_id"]
 
@@ -59,44 +57,58 @@ async def backup_command_callback(command, ack: AsyncAck, respond, say: AsyncSay
         await respond(str(e), channel=user_id, response_type="ephemeral")
         return
 
-    # Send initial response
-    thread = await say(
-        f"Starting backup of #{channel_name} for the last {days} days. This may take a few moments...", channel=user_id
-    )
-
     try:
-        messages = await slack_routes.get_channel_history(client=client, channel_id=channel_id, days=days)
-
-        # Prepare backup data
-        backup_data = {
-            "channel": channel_name,
-            "days": days,
-            "message_count": len(messages),
-            "messages": messages,
-        }
-
-        print(thread)
-
-        # Upload backup file
-        await client.files_upload_v2(
-            filename=f"backup_{channel_name}.json",
-            title=f"Channel Backup for #{channel_name}",
-            channel=thread["channel"],
-            thread=thread["ts"],
-            content=json.dumps(backup_data),
-            initial_comment=f"Here's your backup of #{channel_name} for the last {days} days. Contains {len(messages)} messages.",
+        # the status message and the history fetch don't depend on each other
+        thread, messages = await asyncio.gather(
+            say(
+                f"Starting backup of #{channel_name} for the last {days} days. This may take a few moments...",
+                channel=user_id,
+            ),
+            slack_routes.get_channel_history(client=client, channel_id=channel_id, days=days),
         )
 
-        # Generate chat summary
-        response = await summarize_chat_messages(
-            messages=messages,
+        # Prepare backup data, serialized straight to bytes so no intermediate str copy of the history is held
+        backup_file = orjson.dumps(
+            {
+                "channel": channel_name,
+                "days": days,
+                "message_count": len(messages),
+                "messages": messages,
+            }
         )
 
+        logger.debug("backup thread: %s", thread)
+
+        # Upload backup file and generate chat summary concurrently, both only need `messages`.
+        # a failed summary cancels the upload; a failed upload only cancels this command's wait on the summary,
+        # since the model run itself is shielded and shared with other callers, and still finishes into the cache
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    client.files_upload_v2(
+                        filename=f"backup_{channel_name}.json",
+                        title=f"Channel Backup for #{channel_name}",
+                        channel=thread["channel"],
+                        thread_ts=thread["ts"],
+                        file=backup_file,
+                        initial_comment=(
+                            f"Here's your backup of #{channel_name} for the last {days} days. "
+                            f"Contains {len(messages)} messages."
+                        ),
+                    )
+                )
+                summary_task = tg.create_task(summarize_chat_messages(messages=messages, channel_id=channel_id))
+        except ExceptionGroup as eg:
+            # surface the original error rather than the group wrapper
+            raise eg.exceptions[0]
+
+        response = summary_task.result()
+
         channel_hyperlink = f"<#{channel_id}|{channel_name}>"
 
         await say(
-            f"<@{user_id}> here is a {days}-day summary of {channel_hyperlink}\n {response.data}",
-            channel=thread["channel_id"],
+            f"<@{user_id}> here is a {days}-day summary of {channel_hyperlink}\n {response.output}",
+            channel=thread["channel"],
             thread_ts=thread["ts"],
             mrkdwn=True,
         )
@@ -1,5 +1,5 @@
 from src.utils.slack import remove_slack_user_mentions  # Fix import for Slack utilities
-from src.services.domo import domo_auth
+from src.services.domo import domo_auth, domo_session
 
 import domolibrary.routes.workflows as workflow_routes
 from slack_bolt.async_app import AsyncAck, AsyncSay
@@ -27,6 +27,7 @@ async def trigger_domo_llms_workflow(question, channel_id, message_id, user_id):
         version_id=domo_model_version_id,
         execution_parameters=execution_params,
         debug_api=False,
+        session=domo_session,
     )
 
 
@@ -37,8 +38,8 @@ async def question_command_callback(
     logger: Logger,
 ):
     await ack()
-    logger.info(command)
-    print("question_command_callback", command)
+    logger.debug("slash command: %s", command)
+    logger.info("cmd user=%s channel=%s", command.get("user_id"), command.get("channel_id"))
 
     user_id = command["user_id"]
     channel_id = command["channel_id"]
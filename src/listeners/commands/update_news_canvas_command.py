@@ -1,22 +1,27 @@
 from src.services.routes.slack.channel import search_channel_by_name, get_channel_history
-from src.services.routes.slack.canvas import upsert_canvas, update_canvas_title, get_channel_canvases
+from src.services.routes.slack.canvas import (
+    create_canvas,
+    get_channel_canvases,
+    replace_canvas_content,
+    update_canvas_title,
+)
 from src.services.openai_agent import summarize_chat_messages
 from src.services.routes.slack.files import get_files
 
 from slack_bolt.async_app import AsyncAck
 from logging import Logger
 from typing import Tuple
+import asyncio
 import datetime as dt
 
 
-async def validate_update_news_canvas_command(client, command_text: str, canvas_title: str) -> Tuple[str, str]:
+async def validate_update_news_canvas_command(client, command_text: str) -> Tuple[str, str]:
     """
-    Validates the `/update-news-canvas` command and retrieves the channel and canvas details.
+    Validates the `/update-news-canvas` command and retrieves the channel details.
 
     Args:
         client: The Slack client instance.
         command_text (str): The text of the command entered by the user.
-        canvas_title (str): The title of the canvas to validate.
 
     Returns:
         Tuple[str, str]: The channel ID and channel name.
@@ -24,28 +29,19 @@ async def validate_update_news_canvas_command(client, command_text: str, canvas_
     Raises:
         ValueError: If the command format is invalid or the channel is not found.
     """
-    parts = command_text.split()
+    channel_name, _, _ = command_text.strip().partition(" ")
 
-    if len(parts) < 1:
+    if not channel_name:
         raise ValueError("Usage: /update-news-canvas <channel_name>")
 
-    channel_name = parts[0].strip()
-
-    if channel_name.startswith("#"):
-        channel_name = channel_name[1:]  # Remove the '#' prefix if present
+    channel_name = channel_name.removeprefix("#")  # Remove the '#' prefix if present
 
     channel_id = await search_channel_by_name(client, channel_name)
 
     if not channel_id:
         raise ValueError(f"Channel '{channel_name}' not found. Make sure the bot is invited to the channel.")
 
-    canvases = await get_channel_canvases(client, channel_id=channel_id)
-
-    print("🌈🌈")
-
-    canvas = next((canvas for canvas in canvases if canvas.get("data").get("title", "").startswith(canvas_title)), None)
-
-    return channel_id, channel_name, canvas and canvas.get("id"), canvas and canvas.get("data", {}).get("file_id")
+    return channel_id, channel_name
 
 
 async def update_news_canvas_command_callback(command, ack: AsyncAck, say, respond, client, logger: Logger):
@@ -68,43 +64,46 @@ async def update_news_canvas_command_callback(command, ack: AsyncAck, say, respo
     thread_ts = command.get("thread_ts") or command.get("ts")
     command_text = command.get("text", "").strip()
 
-    channel_id, channel_name, canvas_id, file_id = None, None, None, None
+    channel_id, channel_name = None, None
 
     try:
-        channel_id, channel_name, canvas_id, file_id = await validate_update_news_canvas_command(
-            client, command_text=command_text, canvas_title=canvas_title
-        )
+        channel_id, channel_name = await validate_update_news_canvas_command(client, command_text=command_text)
 
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         return await respond(str(e), response_type="ephemeral")
 
-    said = await say(f"Give me a sec to think about it.  🌈", thread_ts=thread_ts)
+    # once the channel is known, the status message, history and canvas lookup are independent
+    async with asyncio.TaskGroup() as tg:
+        said_task = tg.create_task(say(f"Give me a sec to think about it.  🌈", thread_ts=thread_ts))
+        messages_task = tg.create_task(get_channel_history(client=client, channel_id=channel_id, days=days))
+        canvases_task = tg.create_task(get_channel_canvases(client, channel_id=channel_id))
+
+    said, messages, canvases = said_task.result(), messages_task.result(), canvases_task.result()
 
-    messages = await get_channel_history(client=client, channel_id=channel_id, days=days)
+    canvas = next(
+        (canvas for canvas in canvases if (canvas.get("data") or {}).get("title", "").startswith(canvas_title)), None
+    )
 
     if not messages:
         message = f"No messages found in channel #{channel_name} for the last 5 days."
         logger.error(message)
         return await respond(message, response_type="ephemeral")
 
-    response = await summarize_chat_messages(messages=messages)
+    response = await summarize_chat_messages(messages=messages, channel_id=channel_id)
 
-    # Upsert the summary into the canvas
+    # Update the existing news canvas in place, or create one if the channel doesn't have it yet
     try:
         canvas_title = f"News - updated{dt.datetime.now().strftime(' %Y-%m-%d %H:%M')}"
 
-        res = await upsert_canvas(
-            client=client, channel_id=channel_id, title=canvas_title, document_md=response.data, is_append_if_exists=False
-        )
+        if canvas:
+            canvas_id = canvas["data"].get("file_id") or canvas["data"]["id"]
 
-        # canvas_id = res["canvas_id"]
+            await replace_canvas_content(client=client, canvas_id=canvas_id, markdown_text=response.output)
+            await update_canvas_title(client=client, canvas_id=canvas_id, new_title=canvas_title)
 
-        # await update_canvas_title(
-        #     client=client,
-        #     canvas_id=canvas_id,
-        #     new_title=canvas_title,
-        # )
+        else:
+            await create_canvas(client=client, channel_id=channel_id, document_md=response.output, title=canvas_title)
 
         # Respond with success message
         channel_link = f"<#{channel_id}|{channel_name}>"
@@ -6,16 +6,13 @@ from src.services.routes.slack.canvas import upsert_canvas
 
 
 async def validate_update_canvas_command(client, command_text: str) -> Tuple[str, str, str]:
-    parts = command_text.split()
+    channel_name, _, rest = command_text.strip().partition(" ")
+    canvas_name, _, _ = rest.lstrip().partition(" ")
 
-    if len(parts) < 2:
+    if not canvas_name:
         raise ValueError("Usage: /upsert-canvas channel_name canvas_name")
 
-    channel_name = parts[0].strip()
-    canvas_name = parts[1].strip()
-
-    if channel_name.startswith("#"):
-        channel_name = channel_name[1:]  # Remove the '#' prefix if present
+    channel_name = channel_name.removeprefix("#")  # Remove the '#' prefix if present
 
     channel_id = await search_channel_by_name(client, channel_name)
 
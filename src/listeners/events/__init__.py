@@ -1,5 +1,7 @@
 from slack_bolt.async_app import AsyncApp as AsyncSlackApp
 
+from .channel_changed import channel_changed_callback
+
 # from .app_mention import app_mention_callback
 # from .app_home_opened import app_home_opened_callback
 
@@ -7,4 +9,6 @@ from slack_bolt.async_app import AsyncApp as AsyncSlackApp
 def register(app: AsyncSlackApp):
     # app.event("app_mention")(app_mention_callback)
     # app.event("app_home_opened")(app_home_opened_callback)
-    pass
+    app.event("channel_created")(channel_changed_callback)
+    app.event("channel_rename")(channel_changed_callback)
+    app.event("group_rename")(channel_changed_callback)
@@ -0,0 +1,9 @@
+from logging import Logger
+
+from src.services.routes.slack.channel import clear_channel_id_cache
+
+
+async def channel_changed_callback(event, logger: Logger):
+    # a new or renamed channel, public or private, makes the cached name -> id map stale
+    clear_channel_id_cache()
+    logger.debug("channel %s: %s, cleared channel id cache", event["type"], event["channel"].get("id"))
@@ -1,31 +1,38 @@
+import functools
 import logging
 
 from slack_bolt.async_app import AsyncSay
-from utils.pydantic_agent_generator import generate_pydantic_agent, generate_agent_dependencies, generate_model
-from services.routes.slack.auth import validate_bot_auth
+from src.utils.pydantic_agent_generator import generate_pydantic_agent, get_agent_dependencies, get_model
 
 logger = logging.getLogger(__name__)
 
-agent_deps = generate_agent_dependencies()
-openai_agent = generate_pydantic_agent(system_prompt="You are a helpful AI assistant for Slack messages.")
-openai_model = generate_model()
 
+@functools.cache
+def get_openai_agent():
+    """Builds the Slack message agent on first use rather than at import."""
+    return generate_pydantic_agent(system_prompt="You are a helpful AI assistant for Slack messages.")
 
-async def bot_message_callback(message, say: AsyncSay):
-    try:
-        print(message)
 
-        user_message = message["text"]
+async def bot_mentioned(message, context) -> bool:
+    """
+    Bolt listener matcher that only lets through messages mentioning the bot,
+    so the callback is never scheduled for the rest of the channel traffic.
+
+    `context.bot_user_id` is filled in by Bolt's authorization, so no API call is needed.
+    """
+    bot_user_id = context.bot_user_id
+    return bool(bot_user_id) and f"<@{bot_user_id}>" in (message.get("text") or "")
 
-        # Fetch the bot's user ID from the /slack/auth-test route
-        auth = await validate_bot_auth()
 
-        bot_user_id = auth.get("bot_user_id")
+async def bot_message_callback(message, context, say: AsyncSay):
+    try:
+        logger.debug("bot message: %s", message)
+
+        user_message = message.get("text") or ""
 
-        # Check if the bot is mentioned in the message
-        if bot_user_id not in user_message:
-            print("nope", bot_user_id, user_message)
-            logger.info("Bot not mentioned in the message. Ignoring.")
+        # Check if the bot is mentioned in the message, using the same check as the listener matcher
+        if not await bot_mentioned(message, context):
+            logger.debug("Bot not mentioned in the message. Ignoring.")
             return
 
         user_id = message["user"]
@@ -35,10 +42,10 @@ async def bot_message_callback(message, say: AsyncSay):
         said = await say(f"Give me a sec to think about it.  🌈", thread_ts=thread_ts)
 
         # Call the OpenAI agent to handle the request
-        response = await openai_agent.run(user_prompt=user_message, deps=agent_deps, model=openai_model)
+        response = await get_openai_agent().run(user_prompt=user_message, deps=get_agent_dependencies(), model=get_model())
 
         # Extract the bot's reply from the response
-        bot_reply = f"<@{user_id}> {response.data or 'No response from OpenAI'}"
+        bot_reply = f"<@{user_id}> {response.output or 'No response from OpenAI'}"
 
         # Send the bot's reply back to Slack
         await say(bot_reply, channel=channel_id, thread_ts=said["ts"])
@@ -0,0 +1,12 @@
+from src.services.routes.slack import get_slack_client
+
+
+async def use_shared_slack_client(context, next):
+    """
+    Bolt global middleware that hands listeners the shared, pooled Slack client.
+
+    Bolt otherwise builds a session-less client per request, so every API call a listener makes
+    (including `say`, which is built from `context.client`) opens and tears down its own aiohttp session.
+    """
+    context["client"] = get_slack_client()
+    await next()
@@ -2,13 +2,17 @@
 This module provides authentication for interacting with Domo APIs.
 
 It initializes a `DomoTokenAuth` object using environment variables for the
-Domo access token and instance.
+Domo access token and instance, and a shared `httpx.AsyncClient` so Domo
+API calls reuse pooled connections instead of opening one per request.
 """
 
 import domolibrary.client.DomoAuth as dmda
+import httpx
 import os
 
 domo_auth = dmda.DomoTokenAuth(
     domo_access_token=os.environ["DOMO_ACCESS_TOKEN"],
     domo_instance=os.environ["DOMO_INSTANCE"],
 )
+
+domo_session = httpx.AsyncClient()
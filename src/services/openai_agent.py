@@ -5,22 +5,64 @@ chat messages and generating AI-powered responses.
 It uses the `pydantic-ai` library to simplify schema-based AI interactions.
 """
 
-from utils.pydantic_agent_generator import (
+from src.utils.pydantic_agent_generator import (
     generate_pydantic_agent,
     PydanticAIDependencies,
-    generate_agent_dependencies,
-    generate_model,
+    get_agent_dependencies,
+    get_model,
+    openai_model_name,
 )
 
+from src.services import summary_cache
+
 from pydantic_ai import RunContext
+from pydantic_ai.exceptions import UnexpectedModelBehavior
 
-from openai import OpenAIError
-import json
-from typing import List
+import asyncio
+import os
+import textwrap
+from typing import Dict, List, Tuple
 import logging
+import orjson
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
 
 logger = logging.getLogger(__name__)
-openai_agent = generate_pydantic_agent()
+
+# upper bound on concurrent agent runs, sized to the account's rate-limit headroom;
+# rate-limit and timeout errors are already retried with backoff by the openai client (max_retries)
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "20"))
+
+_openai_sem = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+_AGENT_SYSTEM_PROMPT = "you are a senior executive assistant who excels at summarizing chat conversations"
+
+# static and whitespace-normalized so every request shares the same prompt prefix (and the provider's prompt cache);
+# the chat history itself only ever goes in the user message
+_SUMMARIZE_SYSTEM_PROMPT = """
+    You are a helpful assistant that summarizes chat histories. Format the response as slack-compatible markdown.
+    sample response:
+    ## Channel activity
+    <users who joined>
+
+    ## Discussion Topics
+    <short summary information, user(s) involved, link to conversation>
+
+    ## Actions or Agreements
+    <any action items or agreements made during the discussion, including who is responsible and due dates if mentioned,
+    link to conversation>
+
+    ## Bugs or Problems Identified
+    <any bugs or problems identified during the discussion, including who reported them and any follow-up actions
+    required, link to conversation>
+    """
+_SUMMARIZE_SYSTEM_PROMPT = textwrap.dedent(_SUMMARIZE_SYSTEM_PROMPT).strip()
+
+# built once, before the tool decorators below, so the tools are registered on the agent that actually runs
+openai_agent = generate_pydantic_agent(system_prompt=_AGENT_SYSTEM_PROMPT)
 
 
 @openai_agent.tool
@@ -36,10 +78,11 @@ async def call_chat_completion(ctx: RunContext[PydanticAIDependencies], messages
         dict: A response from OpenAI's chat completion API or an error message.
     """
     try:
-        response = await ctx.deps.openai.chat.completions.create(messages=messages)
+        response = await ctx.deps.openai.chat.completions.create(model=openai_model_name, messages=messages)
         return response
-    except OpenAIError as e:
-        print(e)
+    # any failure goes back to the model as a tool result rather than failing the whole agent run
+    except Exception as e:
+        logger.error("OpenAI API error: %s", e)
         return {"error": str(e)}
 
 
@@ -59,79 +102,197 @@ async def summarize_text(
         dict: A response containing the summarized text or an error message.
     """
 
-    system_prompt = """You are a helpful assistant that summarizes chat histories.  Format the response as in slack-compatible markdown format.
-    sample response:
-    ## Channel activity
-    < users who joined>
-
-    ## Discussion Topics
-    < short summary information, user(s) involved, link to conversation
-    
-    ## Actions or Agreements
-    < any action items or agreements made during the discussion, including who is responsible and due dates if mentioned, link to conversation >
-
-    ## Bugs or Problems Identified
-    < any bugs or problems identified during the discussion, including who reported them and any follow-up actions required, link to conversation >
-    """
-
-    user_content = "Provide a very detailed summary of the following chat history:\n\n" + json.dumps(messages)
+    user_content = "Provide a very detailed summary of the following chat history:\n\n" + _dumps(messages)
 
     if not ctx.deps.openai:
         raise ValueError("OpenAI client is not initialized in the context dependencies.")
 
     try:
         return await ctx.deps.openai.chat.completions.create(
+            model=openai_model_name,
             messages=[
                 {
-                    "prompt": "system",
-                    "content": system_prompt,
+                    "role": "system",
+                    "content": _SUMMARIZE_SYSTEM_PROMPT,
                 },
                 {"role": "user", "content": user_content},
             ],
+            # low temperature keeps repeated summaries of the same history consistent
+            temperature=0.2,
         )
 
-    except OpenAIError as e:
+    except Exception as e:
         logger.error("OpenAI API error: %s", e)
         return {"error": str(e)}
 
 
-def format_message(messages: List[dict]) -> List[dict]:
+# longest message text sent to the summarizer, in characters
+SUMMARY_TEXT_LIMIT = 512
+
+# message subtypes that carry no conversation content, e.g. the bot's own earlier summaries
+_SUMMARY_SKIP_SUBTYPES = frozenset({"bot_message"})
+
+
+def format_for_summary(messages: List[dict]) -> List[dict]:
     """
-    Maps over messages and retains only fields of interest.
+    Compacts messages to the fields the summarizer reads, keeping the prompt small.
+
+    Bot messages are dropped, long texts are truncated to `SUMMARY_TEXT_LIMIT` and
+    consecutive duplicate texts are collapsed.
 
     Args:
         messages (List[dict]): A list of message dictionaries.
 
     Returns:
-        List[dict]: A list of formatted message dictionaries.
-    """
-    return [
-        {
-            "user_id": msg.get("user_id") or msg.get("user"),  # Fallback to 'user' if 'user_id' is not present
-            "user_name": msg.get("user_name") or msg.get("username"),  # Fallback to 'username' if 'user_name' is not present
-            "text": msg.get("text").strip(),
-            "timestamp": msg.get("ts"),
-        }
-        for msg in messages
-    ]
+        List[dict]: A list of `{"u": user, "t": text}` dictionaries.
+    """
+    get = dict.get
 
+    result = []
+    last_text = None
 
-openai_agent = generate_pydantic_agent(
-    system_prompt="""you are a senior executive assistant who excels at summarizing chat conversations"""
-)
+    for msg in messages:
+        if get(msg, "subtype") in _SUMMARY_SKIP_SUBTYPES:
+            continue
+
+        text = (get(msg, "text") or "").strip()[:SUMMARY_TEXT_LIMIT]
+
+        if text == last_text:
+            continue
+
+        last_text = text
+        result.append({"u": get(msg, "user_name") or get(msg, "username") or get(msg, "user"), "t": text})
+
+    return result
+
+
+async def _run_agent(user_prompt: str, output_type=None):
+    """
+    Runs `openai_agent` with the shared model and dependencies, at most `OPENAI_MAX_CONCURRENCY` at a time.
+
+    Tool calls made during a run are covered by that run's slot, so the tools don't take the semaphore themselves.
+
+    Args:
+        user_prompt (str): The prompt to run.
+        output_type (optional): A structured output type for this run. Defaults to the agent's plain text output.
+
+    Returns:
+        The agent run result.
+    """
+    async with _openai_sem:
+        return await openai_agent.run(
+            user_prompt=user_prompt, output_type=output_type, deps=get_agent_dependencies(), model=get_model()
+        )
+
+
+# bump when the summary prompt changes so cached summaries from the old prompt are not reused
+SUMMARY_PROMPT_VERSION = "3"
+
+# histories longer than this are condensed before the final summary
+COMPACT_MAX_MESSAGES = 200
+# approximate size of each condensed chunk, ~4k tokens
+COMPACT_CHUNK_CHARS = 16_000
+
+
+async def _compact(messages: List[dict], max_size: int = COMPACT_MAX_MESSAGES, keep_first: int = 5, ratio: float = 0.75):
+    """
+    Condenses a long, chronological `format_for_summary` list so the final prompt stays bounded.
+
+    The first `keep_first` messages are pinned, the most recent `max_size * (1 - ratio)` are kept
+    verbatim, and the middle is replaced with one summary item per ~`COMPACT_CHUNK_CHARS` chunk.
+
+    Args:
+        messages (List[dict]): Formatted messages, oldest first.
+        max_size (int, optional): Message count above which compaction kicks in.
+        keep_first (int, optional): Number of leading messages kept verbatim.
+        ratio (float, optional): Share of `max_size` given to the summarized middle.
+
+    Returns:
+        List[dict]: `messages` unchanged if short enough, otherwise head + chunk summaries + tail.
+    """
+    if len(messages) <= max_size:
+        return messages
+
+    tail_size = int(max_size * (1 - ratio))
+    # sliced from an explicit index, since a tail size of 0 would make `[-0:]` the whole list
+    tail_start = len(messages) - tail_size
+    head, middle, tail = messages[:keep_first], messages[keep_first:tail_start], messages[tail_start:]
+
+    chunks, chunk, chunk_chars = [], [], 0
+
+    for msg in middle:
+        chunk.append(msg)
+        chunk_chars += len(msg["t"])
+
+        if chunk_chars >= COMPACT_CHUNK_CHARS:
+            chunks.append(chunk)
+            chunk, chunk_chars = [], 0
+
+    if chunk:
+        chunks.append(chunk)
+
+    # a failed chunk cancels the rest rather than leaving them running
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(
+                _run_agent("Briefly summarize this part of a chat conversation, keeping who said what: " + _dumps(chunk))
+            )
+            for chunk in chunks
+        ]
+
+    return head + [{"u": "summary of earlier messages", "t": task.result().output} for task in tasks] + tail
+
+
+# summary cache key -> task generating that summary
+_inflight_summaries: Dict[str, asyncio.Task] = {}
+
+
+async def _generate_summary(messages: List[dict], cache_key: str):
+    """Runs the summarizer on a cache miss and stores the result under `cache_key`."""
+    formatted = await _compact(format_for_summary(messages))
+
+    # Generate summary using OpenAI
+    messages_json = _dumps(formatted)
+    user_prompt = f'Summarize the following chat messages, given as a JSON list of {{"u": user, "t": text}}: {messages_json}'
 
-agent_deps = generate_agent_dependencies()
-openai_model = generate_model()
+    response = await _run_agent(user_prompt)
+
+    await summary_cache.set(cache_key, response)
+
+    return response
+
+
+def _summary_cache_key(messages: List[dict], channel_id: str = None) -> str:
+    """
+    Builds the summary cache key from message timestamps rather than message content.
+
+    A message's `ts` identifies it within a channel and `edited.ts` changes whenever its text does,
+    so the key changes with the history without formatting or serializing any message text.
+
+    Args:
+        messages (List[dict]): Chronologically sorted messages.
+        channel_id (str, optional): The channel the messages came from.
+
+    Returns:
+        str: The cache key.
+    """
+    get = dict.get
+
+    timestamps = "\n".join(f"{get(msg, 'ts')}:{(get(msg, 'edited') or {}).get('ts', '')}" for msg in messages)
+
+    return summary_cache.make_key(SUMMARY_PROMPT_VERSION, channel_id or "", timestamps)
 
 
 async def summarize_chat_messages(
     messages: List[dict],
+    channel_id: str = None,
 ):
     """
     Summarizes chat messages using OpenAI's chat completion API.
 
     Args:
         messages (List[dict]): A list of message dictionaries to summarize.
+        channel_id (str, optional): The channel the messages came from, used to scope the summary cache.
 
     Returns:
         str: The summarized text or an error message.
@@ -139,7 +300,155 @@ async def summarize_chat_messages(
     if not messages:
         return "No messages to summarize."
 
-    # Generate summary using OpenAI
-    user_prompt = f"Summarize the following chat messages: {json.dumps(format_message(messages))}"
+    # Slack returns history newest first; the summarizer and `_compact` expect chronological order
+    messages = sorted(messages, key=lambda msg: msg.get("ts", ""))
+
+    cache_key = _summary_cache_key(messages, channel_id)
+    cached = await summary_cache.get(cache_key)
+
+    if cached is not None:
+        return cached
+
+    # identical requests arriving while a summary is being generated share that one model call
+    task = _inflight_summaries.get(cache_key)
+
+    if task is None:
+        task = asyncio.create_task(_generate_summary(messages, cache_key))
+        _inflight_summaries[cache_key] = task
+        task.add_done_callback(lambda _: _inflight_summaries.pop(cache_key, None))
+
+    # shielded so one caller being cancelled doesn't cancel the summary for the others
+    return await asyncio.shield(task)
+
+
+async def summarize_chat_messages_batch(batches: List[Tuple[str, List[dict]]]) -> Dict[str, str]:
+    """
+    Summarizes several channels' messages with a single model call.
+
+    One request shares the system prompt and round trip across all channels, which is cheaper
+    than calling `summarize_chat_messages` once per channel when summarizing many at once.
+
+    Args:
+        batches (List[Tuple[str, List[dict]]]): `(channel_id, messages)` pairs to summarize.
+
+    Returns:
+        Dict[str, str]: The summary for each channel id; channels with no messages are omitted.
+    """
+    batches = [(channel_id, messages) for channel_id, messages in batches if messages]
+
+    if not batches:
+        return {}
+
+    compacted = await asyncio.gather(
+        *(_compact(format_for_summary(sorted(messages, key=lambda msg: msg.get("ts", "")))) for _, messages in batches)
+    )
+    payload = {channel_id: formatted for (channel_id, _), formatted in zip(batches, compacted)}
+
+    user_prompt = (
+        "Summarize each channel's messages, keyed by channel id. "
+        'The messages are given as a JSON object mapping channel id to a list of {"u": user, "t": text}: ' + _dumps(payload)
+    )
+
+    try:
+        response = await _run_agent(user_prompt, output_type=Dict[str, str])
+        summaries = response.output
+
+    except UnexpectedModelBehavior as e:
+        logger.warning(f"Batch summary output could not be parsed, summarizing per channel: {e}")
+        summaries = {}
+
+    # channels the batch call dropped (or all of them, if it failed) are summarized individually
+    missing = [(channel_id, messages) for channel_id, messages in batches if channel_id not in summaries]
+
+    if missing:
+        fallbacks = await asyncio.gather(
+            *(summarize_chat_messages(messages, channel_id=channel_id) for channel_id, messages in missing)
+        )
+        summaries.update({channel_id: result.output for (channel_id, _), result in zip(missing, fallbacks)})
+
+    return {channel_id: summaries[channel_id] for channel_id, _ in batches}
+
+
+# terminal states of an OpenAI batch job
+_BATCH_DONE_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+async def summarize_chat_messages_batch_api(jobs: List[dict]) -> str:
+    """
+    Submits channel summaries to the OpenAI Batch API, for summaries that don't need an immediate answer.
+
+    Batch jobs cost half as much as synchronous calls and complete within 24 hours; collect the
+    results with `get_batch_summaries`. On-demand summaries should keep using `summarize_chat_messages`.
+
+    Args:
+        jobs (List[dict]): `{"custom_id": ..., "messages": [...]}` dictionaries, e.g. one per channel id.
+
+    Returns:
+        str: The id of the created batch.
+    """
+    lines = []
+
+    for job in jobs:
+        formatted = format_for_summary(sorted(job["messages"], key=lambda msg: msg.get("ts", "")))
+
+        body = {
+            "model": openai_model_name,
+            "messages": [
+                {"role": "system", "content": _AGENT_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": 'Summarize the following chat messages, given as a JSON list of {"u": user, "t": text}: '
+                    + _dumps(formatted),
+                },
+            ],
+        }
+        lines.append(_dumps({"custom_id": job["custom_id"], "method": "POST", "url": "/v1/chat/completions", "body": body}))
+
+    openai = get_agent_dependencies().openai
+
+    batch_file = await openai.files.create(file=("summaries.jsonl", "\n".join(lines).encode()), purpose="batch")
+    batch = await openai.batches.create(
+        input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+    )
+
+    return batch.id
+
+
+async def get_batch_summaries(batch_id: str, poll_interval: float = 60) -> Dict[str, str]:
+    """
+    Waits for a batch created by `summarize_chat_messages_batch_api` and reads its summaries.
+
+    Args:
+        batch_id (str): The id of the batch.
+        poll_interval (float, optional): Seconds between status checks. Defaults to 60.
+
+    Returns:
+        Dict[str, str]: The summary for each job's `custom_id`; failed jobs are omitted.
+    """
+    openai = get_agent_dependencies().openai
+
+    batch = await openai.batches.retrieve(batch_id)
+
+    while batch.status not in _BATCH_DONE_STATUSES:
+        await asyncio.sleep(poll_interval)
+        batch = await openai.batches.retrieve(batch_id)
+
+    if not batch.output_file_id:
+        logger.error("Batch %s finished as %s with no output", batch_id, batch.status)
+        return {}
+
+    output = await openai.files.content(batch.output_file_id)
+
+    summaries = {}
+
+    for line in output.text.splitlines():
+        result = orjson.loads(line)
+        response = result.get("response") or {}
+
+        if response.get("status_code") != 200:
+            logger.error("Batch %s request %s failed: %s", batch_id, result.get("custom_id"), result.get("error"))
+            continue
+
+        summaries[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
 
-    return await openai_agent.run(user_prompt=user_prompt, deps=agent_deps, model=openai_model)
+    return summaries
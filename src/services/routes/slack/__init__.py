@@ -1,4 +1,54 @@
+import os
+from typing import Optional
+
+import aiohttp
+import orjson
+from slack_sdk.web.async_client import AsyncWebClient
+
+
 class SlackError(Exception):
 
     def __init__(self, message):
         super().__init__(message)
+
+
+class _OrjsonClientResponse(aiohttp.ClientResponse):
+    """Parses JSON bodies with orjson, which matters on large `conversations.history` and `files.list` pages."""
+
+    async def json(self, *, encoding=None, loads=None, content_type="application/json"):
+        return await super().json(encoding=encoding, loads=loads or orjson.loads, content_type=content_type)
+
+
+# without a session the sdk opens (and tears down) a new aiohttp session for every api call
+_client_singleton: Optional[AsyncWebClient] = None
+
+
+def get_slack_client() -> AsyncWebClient:
+    """
+    Returns the process-wide Slack client, built on first use.
+
+    The client shares one pooled aiohttp session, so keep-alive connections are reused across calls.
+    It must first be called from a running event loop, since the session binds to it.
+
+    Returns:
+        AsyncWebClient: The shared Slack client, authenticated with `SLACK_BOT_TOKEN`.
+    """
+    global _client_singleton
+
+    if _client_singleton is None:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=20, keepalive_timeout=75),
+            response_class=_OrjsonClientResponse,
+        )
+        _client_singleton = AsyncWebClient(token=os.environ["SLACK_BOT_TOKEN"], session=session)
+
+    return _client_singleton
+
+
+async def close_slack_client() -> None:
+    """Closes the shared Slack client's session, if one was created."""
+    global _client_singleton
+
+    if _client_singleton is not None:
+        await _client_singleton.session.close()
+        _client_singleton = None
@@ -4,30 +4,43 @@ This module provides a function to validate the bot's authentication with Slack.
 It uses the Slack API's `auth.test` method to verify the bot's credentials.
 """
 
+from typing import Dict
+
+from . import get_slack_client
+
+# bot token -> auth.test result; a token's bot identity doesn't change while the process runs
+_bot_auth_cache: Dict[str, dict] = {}
+
 
 async def validate_bot_auth(client=None):
     """
     Validates the bot's authentication with Slack.
 
+    Successful results are cached per bot token; errors are not, so a transient failure is retried on the next call.
+
     Args:
-        client: The Slack client instance. If not provided, it initializes one.
+        client: The Slack client instance. If not provided, the shared client is used.
 
     Returns:
         dict: A dictionary containing bot user ID, username, and workspace information,
               or an error message if validation fails.
     """
-    if not client:
-        from src import slack_app
+    client = client or get_slack_client()
+
+    cache_key = getattr(client, "token", None)
+    cached = _bot_auth_cache.get(cache_key)
 
-        client = slack_app.client
+    if cached:
+        return cached
 
     try:
         auth_test = await client.auth_test()
 
-        return {
+        _bot_auth_cache[cache_key] = {
             "bot_user_id": auth_test["user_id"],
             "bot_username": auth_test["user"],
             "workspace": auth_test["team"],
         }
+        return _bot_auth_cache[cache_key]
     except Exception as e:
         return {"error": str(e)}
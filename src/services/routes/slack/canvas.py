@@ -3,49 +3,103 @@ This module provides functions for managing Slack canvases, including retrieving
 creating, updating, and appending content to canvases.
 """
 
-from typing import List
-import json
+from typing import Dict, List, Tuple
+import copy
+import time
 
+from . import get_slack_client
 from .files import get_files
 
+CHANNEL_CANVASES_CACHE_TTL = 30  # seconds
+FILES_CACHE_TTL = 30  # seconds
 
-async def get_channel_canvases(client, channel_id: str) -> List[dict]:
+# channel id -> (expires_at, canvases); dropped whenever a canvas is created or edited
+_channel_canvases_cache: Dict[str, Tuple[float, List[dict]]] = {}
+
+# bot token -> (expires_at, canvas files); dropped whenever a canvas is created or edited
+_files_cache: Dict[str, Tuple[float, List[dict]]] = {}
+
+
+async def _get_files_cached(client, ttl: float = FILES_CACHE_TTL) -> List[dict]:
     """
-    Retrieves a list of canvases for a given Slack channel.
+    Retrieves the workspace's canvas files, reusing the last `files.list` result for `ttl` seconds.
 
     Args:
         client: The Slack client instance.
+        ttl (float, optional): Seconds to reuse a result for. Defaults to `FILES_CACHE_TTL`.
+
+    Returns:
+        List[dict]: The canvas files.
+    """
+    cache_key = getattr(client, "token", None)
+    cached = _files_cache.get(cache_key)
+
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    files = await get_files(client=client)
+
+    # an empty result usually means files.list failed on the first page, which shouldn't stick for the whole ttl
+    if files:
+        _files_cache[cache_key] = (time.monotonic() + ttl, files)
+
+    return files
+
+
+async def get_channel_canvases(client=None, channel_id: str = None) -> List[dict]:
+    """
+    Retrieves a list of canvases for a given Slack channel.
+
+    Results are cached per channel for `CHANNEL_CANVASES_CACHE_TTL` seconds, since the same
+    command is often retried on the same channel.
+
+    Args:
+        client (optional): The Slack client instance. Defaults to the shared client.
         channel_id (str): The ID of the Slack channel.
 
     Returns:
         List[dict]: A list of canvases or an empty list if none are found.
     """
+    client = client or get_slack_client()
+    cached = _channel_canvases_cache.get(channel_id)
+
+    # callers get their own copy, so editing a returned canvas can't change the cached listing
+    if cached and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
+
     try:
         # Fetch channel information
         response = await client.conversations_info(channel=channel_id)
         channel_info = response.get("channel", {})
 
-        # Extract canvases if available
-        canvases = [obj for obj in channel_info.get("properties", {}).get("tabs", []) if obj.get("type") == "canvas"]
+        tabs = channel_info.get("properties", {}).get("tabs", ())
 
-        if not canvases:
+        # stops at the first canvas tab; channels without any skip files.list entirely
+        if not any(tab.get("type") == "canvas" for tab in tabs):
+            _channel_canvases_cache[channel_id] = (time.monotonic() + CHANNEL_CANVASES_CACHE_TTL, [])
             return []
 
-        files = await get_files(client=client)
+        files = await _get_files_cached(client)
+        files_by_id = {fi["id"]: fi for fi in files if fi.get("id")}
 
-        result = []
+        # filter the canvas tabs and merge each with its file details in one pass
+        canvases = []
 
-        for canvas in canvases:
+        for tab in tabs:
+            if tab.get("type") != "canvas":
+                continue
 
-            result.append(canvas)
+            tab_data = tab.setdefault("data", {})
 
-            fi = next((fi for fi in files if canvas.get("data", {}).get("file_id", None) == fi.get("id")), None)
-            if not fi:
-                continue
+            fi = files_by_id.get(tab_data.get("file_id"))
+            if fi:
+                tab_data.update(fi)
+
+            canvases.append(tab)
 
-            canvas.get("data").update(fi)
+        _channel_canvases_cache[channel_id] = (time.monotonic() + CHANNEL_CANVASES_CACHE_TTL, canvases)
 
-        return result
+        return copy.deepcopy(canvases)
 
     except Exception as e:
         print(f"Error retrieving canvases for channel {channel_id}: {e}")
@@ -64,7 +118,7 @@ async def search_canvas_id_by_name(client, channel_id):
         dict: The canvas object if found, otherwise None.
     """
     canvases = await get_channel_canvases(client=client, channel_id=channel_id)
-    return next((canvas for canvas in canvases if canvas.get("name") == channel_id))
+    return next((canvas for canvas in canvases if canvas.get("name") == channel_id), None)
 
 
 async def create_canvas(client, channel_id: str, document_md: str, title: str) -> dict:
@@ -92,6 +146,11 @@ async def create_canvas(client, channel_id: str, document_md: str, title: str) -
         print(f"Error creating canvas in channel {channel_id}: {e}")
         return {}
 
+    finally:
+        # dropped after the write, so a listing fetched while it was in flight can't be cached as current
+        _channel_canvases_cache.pop(channel_id, None)
+        _files_cache.clear()
+
 
 async def update_canvas(client, canvas_id: str, changes: List[dict]) -> dict:
     """
@@ -114,6 +173,10 @@ async def update_canvas(client, canvas_id: str, changes: List[dict]) -> dict:
     except Exception as e:
         print(f"Error updating canvas {canvas_id}: {e}")
         return {}
+    finally:
+        # an edit can change a title, which both caches hold; the owning channel isn't known here, so drop everything
+        _channel_canvases_cache.clear()
+        _files_cache.clear()
 
 
 async def append_to_canvas(client, canvas_id: str, markdown_text: str) -> dict:
@@ -218,12 +281,11 @@ async def update_canvas_title(client, canvas_id: str, new_title: str) -> dict:
     return await update_canvas(
         client=client,
         canvas_id=canvas_id,
-        changes=json.dumps(
-            [
-                {
-                    "operation": "document_metadata_update",
-                    "title": new_title,
-                }
-            ]
-        ),
+        # canvases.edit sends a JSON body, so the sdk serializes `changes` itself
+        changes=[
+            {
+                "operation": "document_metadata_update",
+                "title": new_title,
+            }
+        ],
     )
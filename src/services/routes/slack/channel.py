@@ -3,60 +3,72 @@ This module provides functions for managing Slack channels, including retrieving
 channel lists, searching for channels by name, and fetching channel history.
 """
 
-from . import SlackError
+from . import SlackError, get_slack_client
+from src.utils.chunk_execution import gather_with_concurrency
+import asyncio
 import time
-from typing import List, Union
+from typing import AsyncIterator, Dict, List, Tuple, Union
 from slack_bolt.async_app import AsyncApp as AsyncSlackApp
 import logging
 
 logger = logging.getLogger(__name__)
 
+CHANNEL_ID_CACHE_TTL = 600  # seconds
+
+# bot token -> (expires_at, {channel_name: channel_id}); only hits are answered from it, a missing name is refetched
+_channel_id_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+# bot token -> lock, so concurrent misses share one conversations.list crawl
+_channel_id_locks: Dict[str, asyncio.Lock] = {}
+
+# concurrent conversations.replies calls per history page, conversations.replies is a tier 3 method
+THREAD_REPLIES_CONCURRENCY = 10
+
 
 async def get_channels(
     client: AsyncSlackApp = None,
     channel_types="public_channel,private_channel,mpim,im",
-    channel_list: List[dict] = None,
     cursor: str = None,
 ) -> List[dict]:
     """
-    Recursively retrieves a list of Slack channels.
+    Retrieves a list of Slack channels, following pagination cursors.
 
     Args:
-        client (AsyncSlackApp): The Slack client instance.
+        client (AsyncSlackApp, optional): The Slack client instance. Defaults to the shared client.
         channel_types (str): Comma-separated types of channels to retrieve.
-        channel_list (List[dict], optional): A list to accumulate channels. Defaults to None.
-        cursor (str, optional): The pagination cursor for fetching the next page. Defaults to None.
+        cursor (str, optional): The pagination cursor to start from. Defaults to None.
 
     Returns:
         List[dict]: A list of channels retrieved from Slack.
     """
-    if client is None:
-        from app import slack_app
+    client = client or get_slack_client()
 
-        client = slack_app.client
+    channel_list: List[dict] = []
 
-    if not channel_list:
-        channel_list = []
+    while True:
+        try:
+            result = await client.conversations_list(types=channel_types, cursor=cursor, limit=1000)
 
-    try:
-        result = await client.conversations_list(channel_types=channel_types, cursor=cursor, limit=100)
-
-    except Exception as e:
-        raise SlackError(f"Error getting channel list: {str(e)}") from e
+        except Exception as e:
+            raise SlackError(f"Error getting channel list: {str(e)}") from e
 
-    channel_list.extend(result["channels"])
+        channel_list.extend(result["channels"])
 
-    next_cursor = result.get("response_metadata", {}).get("next_cursor")
+        cursor = result.get("response_metadata", {}).get("next_cursor")
 
-    if next_cursor:
-        return await get_channels(client, channel_types=channel_types, channel_list=channel_list, cursor=next_cursor)
-    return channel_list
+        if not cursor:
+            return channel_list
 
 
 async def search_channel_by_name(client, channel_name, cursor: str = None) -> Union[str, None]:
     """
     Searches for a channel by name and retrieves its ID.
 
+    `conversations.list` is paginated only until the channel turns up. Every name -> id pair seen on
+    the way is cached per bot token for `CHANNEL_ID_CACHE_TTL` seconds, so repeat lookups skip the API.
+    Misses are never cached: the bot only sees private channels it belongs to, so a name that is missing
+    now can appear as soon as the bot is invited.
+
     Args:
         client: The Slack client instance.
         channel_name (str): The name of the channel to search for.
@@ -68,54 +80,155 @@ async def search_channel_by_name(client, channel_name, cursor: str = None) -> Un
     if channel_name.startswith("#"):
         channel_name = channel_name[1:]
 
-    channel_list = await get_channels(client=client, channel_types="public_channel,private_channel,mpim,im", cursor=cursor)
+    cache_key = getattr(client, "token", None)
 
-    return next((channel["id"] for channel in channel_list if channel["name"] == channel_name), None)
+    def lookup_cached():
+        cached = _channel_id_cache.get(cache_key)
 
+        if cached and cached[0] > time.monotonic():
+            return cached[1].get(channel_name)
 
-async def get_channel_history(client, channel_id: str, days: int = 7, cursor=None, messages: list = None) -> List[dict]:
-    """
-    Retrieves the message history of a Slack channel, including threaded replies.
+        return None
 
-    Args:
-        client: The Slack client instance.
-        channel_id (str): The ID of the Slack channel.
-        days (int, optional): Number of days to look back. Defaults to 7.
-        cursor: Pagination cursor. Defaults to None.
-        messages (list, optional): A list to accumulate messages. Defaults to None.
+    channel_id = lookup_cached()
 
-    Returns:
-        List[dict]: A list of messages retrieved from the channel.
-    """
-    if not messages:
-        messages = []
-    try:
-        # Calculate timestamps for filtering
-        now = int(time.time())
-        oldest = now - (days * 24 * 60 * 60)  # Convert days to seconds
+    if channel_id:
+        return channel_id
+
+    async with _channel_id_locks.setdefault(cache_key, asyncio.Lock()):
+        # another caller may have refreshed the map while this one waited for the lock
+        channel_id = lookup_cached()
 
+        if channel_id:
+            return channel_id
+
+        channel_ids = {}
+
+        while True:
+            try:
+                result = await client.conversations_list(
+                    types="public_channel,private_channel,mpim,im", cursor=cursor, limit=1000
+                )
+
+            except Exception as e:
+                raise SlackError(f"Error getting channel list: {str(e)}") from e
+
+            # direct messages have no name, so they can never match
+            channel_ids.update((channel["name"], channel["id"]) for channel in result["channels"] if channel.get("name"))
+
+            cursor = result.get("response_metadata", {}).get("next_cursor")
+
+            if channel_name in channel_ids or not cursor:
+                break
+
+        _channel_id_cache[cache_key] = (time.monotonic() + CHANNEL_ID_CACHE_TTL, channel_ids)
+
+    return channel_ids.get(channel_name)
+
+
+def clear_channel_id_cache() -> None:
+    """Drops every cached channel name -> id map, e.g. after a channel is created or renamed."""
+    _channel_id_cache.clear()
+
+
+async def _iter_history_pages(client, channel_id: str, days: int, cursor, since_ts: str) -> AsyncIterator[List[dict]]:
+    """Yields each `conversations.history` page, followed by the replies to that page's threads."""
+
+    # Calculate timestamps for filtering, once so every page uses the same window; slack expects a string
+    if since_ts:
+        oldest = since_ts
+    else:
+        oldest = str(int(time.time()) - (days * 24 * 60 * 60))  # Convert days to seconds
+
+    while True:
         result = await client.conversations_history(
             channel=channel_id,
-            limit=100,
+            limit=999,  # conversations.history caps pages at 999
             cursor=cursor,
             oldest=oldest,
         )
 
-        for message in result["messages"]:
-            messages.append(message)
-            # Check if the message has a thread
-            if "thread_ts" in message:
-                thread_replies = await client.conversations_replies(
-                    channel=channel_id,
-                    ts=message["thread_ts"],
-                )
-                # Append all replies to the messages list
-                messages.extend(thread_replies["messages"])
+        yield result["messages"]
+
+        # only thread parents that have replies, so each thread is fetched once rather than once per broadcast reply
+        thread_tss = [
+            message["ts"]
+            for message in result["messages"]
+            if message.get("thread_ts") == message["ts"] and message.get("reply_count", 0)
+        ]
+
+        thread_replies = await gather_with_concurrency(
+            *(client.conversations_replies(channel=channel_id, ts=thread_ts) for thread_ts in thread_tss),
+            n=THREAD_REPLIES_CONCURRENCY,
+            return_exceptions=True,
+        )
 
-        next_cursor = result.get("response_metadata", {}).get("next_cursor")
+        for thread_ts, replies in zip(thread_tss, thread_replies):
+            if isinstance(replies, Exception):
+                logger.warning("Error retrieving replies to %s in %s: %s", thread_ts, channel_id, replies)
+                continue
 
-        if next_cursor:
-            await get_channel_history(client=client, channel_id=channel_id, cursor=next_cursor, messages=messages)
+            # the first message is the thread parent, which is already in the page
+            yield replies["messages"][1:]
+
+        cursor = result.get("response_metadata", {}).get("next_cursor")
+
+        if not cursor:
+            return
+
+
+async def iter_channel_history(
+    client=None, channel_id: str = None, days: int = 7, cursor=None, since_ts: str = None
+) -> AsyncIterator[dict]:
+    """
+    Streams the message history of a Slack channel, including threaded replies, one page at a time.
+
+    Only the current page is held in memory, and a caller that stops iterating early stops the pagination too.
+    Unlike `get_channel_history`, API errors are raised to the caller.
+
+    Args:
+        client (optional): The Slack client instance. Defaults to the shared client.
+        channel_id (str): The ID of the Slack channel.
+        days (int, optional): Number of days to look back. Defaults to 7. Ignored when `since_ts` is given.
+        cursor: Pagination cursor to start from. Defaults to None.
+        since_ts (str, optional): Only fetch messages newer than this timestamp. Defaults to None.
+
+    Yields:
+        dict: Each message, newest page first, with a thread's replies after the page holding its parent.
+    """
+    client = client or get_slack_client()
+
+    async for page in _iter_history_pages(client, channel_id, days, cursor, since_ts):
+        for message in page:
+            yield message
+
+
+async def get_channel_history(
+    client=None, channel_id: str = None, days: int = 7, cursor=None, since_ts: str = None
+) -> List[dict]:
+    """
+    Retrieves the message history of a Slack channel, including threaded replies.
+
+    For incremental polling, pass the newest `ts` seen so far as `since_ts` (e.g. the first message's `ts`,
+    since Slack returns history newest first) to fetch only messages posted after it.
+
+    Args:
+        client (optional): The Slack client instance. Defaults to the shared client.
+        channel_id (str): The ID of the Slack channel.
+        days (int, optional): Number of days to look back. Defaults to 7. Ignored when `since_ts` is given.
+        cursor: Pagination cursor to start from. Defaults to None.
+        since_ts (str, optional): Only fetch messages newer than this timestamp. Defaults to None.
+
+    Returns:
+        List[dict]: A list of messages retrieved from the channel.
+    """
+    client = client or get_slack_client()
+
+    try:
+        messages: List[dict] = []
+
+        async for page in _iter_history_pages(client, channel_id, days, cursor, since_ts):
+            messages.extend(page)
 
         return messages
 
@@ -124,3 +237,29 @@ async def get_channel_history(client, channel_id: str, days: int = 7, cursor=Non
         print(message)
         logger.error(message)
         return []
+
+
+async def get_channel_history_many(
+    client=None, channel_ids: List[str] = None, days: int = 7, concurrency: int = 8
+) -> Dict[str, List[dict]]:
+    """
+    Retrieves the message history of several Slack channels concurrently.
+
+    Args:
+        client (optional): The Slack client instance. Defaults to the shared client.
+        channel_ids (List[str]): The IDs of the Slack channels.
+        days (int, optional): Number of days to look back. Defaults to 7.
+        concurrency (int, optional): Channels fetched at once, kept low for Slack's tier 3 limits. Defaults to 8.
+
+    Returns:
+        Dict[str, List[dict]]: The messages for each channel ID.
+    """
+    client = client or get_slack_client()
+    channel_ids = channel_ids or []
+
+    results = await gather_with_concurrency(
+        *(get_channel_history(client=client, channel_id=channel_id, days=days) for channel_id in channel_ids),
+        n=concurrency,
+    )
+
+    return dict(zip(channel_ids, results))
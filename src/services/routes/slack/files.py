@@ -3,42 +3,71 @@ This module provides functions for managing Slack files, including retrieving
 a list of canvases using the Slack API.
 """
 
+from . import get_slack_client
+
 from slack_bolt.async_app import AsyncApp as AsyncSlackApp
+from slack_sdk.errors import SlackApiError
+import asyncio
 from typing import List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# rate-limited page requests retried before giving up with the pages fetched so far
+FILES_LIST_MAX_RETRIES = 3
+
+# files.list pages by `page`/`count` rather than by cursor
+FILES_LIST_PAGE_SIZE = 1000
 
-async def get_files(client: AsyncSlackApp = None, canvas_list: List[dict] = None, cursor=None):
+
+async def get_files(client: AsyncSlackApp = None, page: int = 1) -> List[dict]:
     """
-    Recursively fetches Slack canvases using the `files.list` API method.
+    Fetches Slack canvases using the `files.list` API method, following `page`/`paging.pages` pagination.
 
     Args:
-        client (AsyncSlackApp): The Slack client instance for making API calls.
-        canvas_list (List[dict], optional): A list to accumulate canvases. Defaults to None.
-        cursor (str, optional): The pagination cursor for fetching the next page. Defaults to None.
+        client (AsyncSlackApp, optional): The Slack client instance for making API calls. Defaults to the shared client.
+        page (int, optional): The page number to start from. Defaults to 1.
 
     Returns:
-        List[dict]: A list of canvases retrieved from Slack.
+        List[dict]: A list of canvases retrieved from Slack; on an API error, the canvases fetched before it.
     """
+    client = client or get_slack_client()
+
+    canvas_list: List[dict] = []
+
+    retries = 0
+
+    while True:
+        logger.info(f"Fetching files page {page}")
+
+        try:
+            result = await client.files_list(types="canvases", count=FILES_LIST_PAGE_SIZE, page=page)
+
+        except SlackApiError as e:
+            if e.response.get("error") != "ratelimited" or retries >= FILES_LIST_MAX_RETRIES:
+                logger.error(f"API Error fetching page: {e.response.get('error')} (Page: {page})")
+                break
 
-    if not canvas_list:
-        canvas_list = []
-    logger.info(f"Fetching page with cursor: {'None' if not cursor else cursor[:10]+'...'}")
+            retries += 1
+            headers = e.response.headers
+            retry_after = int(headers.get("Retry-After") or headers.get("retry-after") or 1)
+            logger.warning(f"Rate limited fetching files, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+            continue
 
-    result = await client.files_list(cursor=cursor, types="canvases")
+        if not result["ok"]:
+            logger.error(f"API Error fetching page: {result['error']} (Page: {page})")
+            break
 
-    if not result["ok"]:
-        logger.error(f"API Error fetching page: {result['error']} (Cursor: {cursor})")
-        # Stop recursion on API error for this branch
-        return []
+        retries = 0
+        canvas_list.extend(result.get("files", []))
 
-    canvas_list.extend(result.get("files", []))
+        paging = result.get("paging") or {}
 
-    next_cursor = result.get("response_metadata", {}).get("next_cursor")
+        if paging.get("page", page) >= paging.get("pages", 0):
+            break
 
-    if next_cursor:
-        return await get_files(client=client, canvas_list=canvas_list, cursor=next_cursor)
+        page = paging.get("page", page) + 1
 
+    # on an error, the pages fetched so far are still returned
     return canvas_list
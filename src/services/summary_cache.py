@@ -0,0 +1,77 @@
+"""
+This module provides an in-process TTL cache for chat summaries, so summarizing
+the same messages again skips the OpenAI call.
+
+The API is async so the backing store can be swapped for a shared one (e.g. Redis)
+without changing callers.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Tuple, Union
+
+DEFAULT_TTL = 60 * 60  # seconds
+MAX_ENTRIES = 256
+
+# key -> (expires_at, value), in insertion order so the oldest entry is evicted first
+_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def make_key(*parts: Union[str, bytes]) -> str:
+    """
+    Builds a cache key from the parts that determine a summary.
+
+    Args:
+        *parts (Union[str, bytes]): e.g. the prompt version and the serialized messages.
+
+    Returns:
+        str: A blake2b hex digest of the parts.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode())
+        digest.update(b"\x00")
+
+    return digest.hexdigest()
+
+
+async def get(key: str) -> Any:
+    """
+    Retrieves a cached value.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        Any: The cached value, or None if missing or expired.
+    """
+    entry = _cache.get(key)
+
+    if entry is None:
+        return None
+
+    expires_at, value = entry
+
+    if expires_at <= time.monotonic():
+        _cache.pop(key, None)
+        return None
+
+    return value
+
+
+async def set(key: str, value: Any, ttl: float = DEFAULT_TTL) -> None:
+    """
+    Stores a value, evicting the oldest entry once `MAX_ENTRIES` is reached.
+
+    Args:
+        key (str): The cache key.
+        value (Any): The value to cache.
+        ttl (float, optional): Seconds until the entry expires. Defaults to `DEFAULT_TTL`.
+    """
+    _cache.pop(key, None)
+
+    if len(_cache) >= MAX_ENTRIES:
+        _cache.pop(next(iter(_cache)))
+
+    _cache[key] = (time.monotonic() + ttl, value)
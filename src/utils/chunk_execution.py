@@ -0,0 +1,24 @@
+import asyncio
+from typing import Any, Awaitable, List
+
+
+async def gather_with_concurrency(*coros: Awaitable, n: int = 10, return_exceptions: bool = False) -> List[Any]:
+    """
+    Runs awaitables like `asyncio.gather`, but with at most `n` of them in flight at once.
+
+    Args:
+        *coros (Awaitable): The awaitables to run.
+        n (int, optional): The maximum number running concurrently. Defaults to 10.
+        return_exceptions (bool, optional): Return exceptions as results instead of raising the first one.
+            Defaults to False.
+
+    Returns:
+        List[Any]: The results, in the same order as `coros`.
+    """
+    semaphore = asyncio.Semaphore(n)
+
+    async def run(coro: Awaitable) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=return_exceptions)
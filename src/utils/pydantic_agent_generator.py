@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+import functools
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAioHttpClient
 
 from pydantic_ai import Agent as PydanticAgent
 from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
 
 import os
 
@@ -11,29 +14,49 @@ import os
 openai_api_key = os.environ["OPENAI_API_KEY"]
 openai_model_name = os.environ["OPENAI_MODEL"]
 
+# shared by every model and dependency set so TLS sessions and keep-alive connections are reused across requests;
+# aiohttp transport (openai[aiohttp]) holds up better than httpx's under many concurrent completions.
+# the limits map onto the aiohttp TCPConnector; closed in the FastAPI lifespan
+openai_http_client = DefaultAioHttpClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+)
+
 
 @dataclass
 class PydanticAIDependencies:
     openai: AsyncOpenAI
 
 
-def generate_model(model_name: str = openai_model_name, provider="openai") -> OpenAIModel:
+def generate_model(model_name: str = openai_model_name, http_client: httpx.AsyncClient = openai_http_client) -> OpenAIModel:
     """Generates an OpenAIModel instance with the specified model name."""
     return OpenAIModel(
         model_name=model_name,
-        provider=provider,
+        provider=OpenAIProvider(api_key=openai_api_key, http_client=http_client),
     )
 
 
 def generate_pydantic_agent(retries=1, system_prompt="you are helpful ai agent"):
     return PydanticAgent(
-        model=generate_model(),
+        model=get_model(),  # agents share one model rather than each building its own provider
         system_prompt=system_prompt,
         deps_type=PydanticAIDependencies,
         retries=retries,
     )
 
 
-def generate_agent_dependencies() -> PydanticAIDependencies:
+def generate_agent_dependencies(http_client: httpx.AsyncClient = openai_http_client) -> PydanticAIDependencies:
+
+    return PydanticAIDependencies(openai=AsyncOpenAI(api_key=openai_api_key, http_client=http_client))
+
+
+@functools.cache
+def get_model() -> OpenAIModel:
+    """Returns the process-wide default model, built on first use."""
+    return generate_model()
+
 
-    return PydanticAIDependencies(openai=AsyncOpenAI(api_key=openai_api_key))
+@functools.cache
+def get_agent_dependencies() -> PydanticAIDependencies:
+    """Returns the process-wide agent dependencies, built on first use."""
+    return generate_agent_dependencies()
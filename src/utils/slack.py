@@ -3,6 +3,9 @@ from typing import Union, List
 from slack_bolt.async_app import AsyncApp as AsyncSlackApp
 import time
 
+# user (U...) and enterprise grid (W...) ids
+_SLACK_USER_MENTION_RE = re.compile(r"<@[UW][A-Z0-9]+>")
+
 
 def remove_slack_user_mentions(text):
     """
@@ -12,12 +15,13 @@ def remove_slack_user_mentions(text):
         text (str): The input text containing potential Slack user mentions.
 
     Returns:
-        str: The text with Slack user mentions removed.
+        str: The text with Slack user mentions and surrounding whitespace removed.
     """
-    pattern = r"<@U[A-Z0-9]+>"
+    # most messages mention nobody; a substring check is far cheaper than running the regex
+    if "<@" not in text:
+        return text.strip()
 
-    cleaned_text = re.sub(pattern, "", text)
-    return cleaned_text
+    return _SLACK_USER_MENTION_RE.sub("", text).strip()
 
 
 def slack_timestamp_to_url(workspace_url: str, channel_id: str, timestamp: str) -> str:
@@ -32,6 +36,6 @@ def slack_timestamp_to_url(workspace_url: str, channel_id: str, timestamp: str)
     Returns:
         str: The URL to the Slack message.
     """
-    # Slack timestamps use a dot as a separator, replace it with an underscore for the URL
-    ts_url = timestamp.replace(".", "_")
+    # message permalinks use the timestamp without its dot (p1681234567890123); it has exactly one
+    ts_url = timestamp.replace(".", "", 1)
     return f"{workspace_url}/archives/{channel_id}/p{ts_url}"
@@ -0,0 +1,8 @@
+import os
+
+# src reads these at import time; tests never reach the real services
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("OPENAI_MODEL", "gpt-4o-mini")
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+os.environ.setdefault("DOMO_ACCESS_TOKEN", "test-domo-token")
+os.environ.setdefault("DOMO_INSTANCE", "test-instance")
@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.listeners.commands import backup_command
+from src.services import openai_agent, summary_cache
+from src.services.openai_agent import summarize_chat_messages
+from src.listeners.commands.backup_command import (
+    _BACKUP_COMMAND_RE,
+    backup_command_callback,
+    validate_backup_history_command,
+)
+from src.utils.ValidationError import ValidationError
+
+
+class TestBackupCommandRe:
+    @pytest.mark.parametrize(
+        "text, channel_name, days",
+        [
+            ("general 7", "general", "7"),
+            ("#general 7", "general", "7"),
+            ("  #team-news   14  ", "team-news", "14"),
+            ("release.notes_v2 3", "release.notes_v2", "3"),
+        ],
+    )
+    def test_parses_channel_and_days(self, text, channel_name, days):
+        match = _BACKUP_COMMAND_RE.match(text)
+
+        assert match["channel_name"] == channel_name
+        assert match["days"] == days
+
+    @pytest.mark.parametrize("text", ["", "general", "7", "general seven", "general 7 extra", "general -7", "#gen eral 7"])
+    def test_rejects_malformed_commands(self, text):
+        assert _BACKUP_COMMAND_RE.match(text) is None
+
+
+class TestValidateBackupHistoryCommand:
+    def setup_method(self):
+        self.fake_client = Mock(AsyncWebClient)
+
+    @pytest.mark.asyncio
+    async def test_returns_channel_and_days(self, monkeypatch):
+        fake_search = AsyncMock(return_value="C123")
+        monkeypatch.setattr(backup_command.slack_routes, "search_channel_by_name", fake_search)
+
+        assert await validate_backup_history_command(self.fake_client, "#general 7") == ("C123", "general", 7)
+        fake_search.assert_awaited_once_with(self.fake_client, "general")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", ["general 0", "general 31", "general"])
+    async def test_rejects_invalid_commands(self, monkeypatch, text):
+        fake_search = AsyncMock(return_value="C123")
+        monkeypatch.setattr(backup_command.slack_routes, "search_channel_by_name", fake_search)
+
+        with pytest.raises(ValidationError):
+            await validate_backup_history_command(self.fake_client, text)
+
+        fake_search.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_channel(self, monkeypatch):
+        monkeypatch.setattr(backup_command.slack_routes, "search_channel_by_name", AsyncMock(return_value=None))
+
+        with pytest.raises(ValidationError):
+            await validate_backup_history_command(self.fake_client, "missing 7")
+
+
+class TestBackupCommandCallback:
+    def setup_method(self):
+        self.fake_ack = AsyncMock()
+        self.fake_respond = AsyncMock()
+        self.fake_say = AsyncMock(return_value={"channel": "D1", "ts": "1.0"})
+        self.fake_client = Mock(AsyncWebClient)
+        self.command = {"user_id": "U1", "channel_id": "C0", "text": "general 7"}
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_reports_error_and_summary_still_caches(self, monkeypatch):
+        summary_cache._cache.clear()
+        openai_agent._inflight_summaries.clear()
+
+        messages = [{"ts": "1.0", "user": "U2", "text": "hello"}]
+        release = asyncio.Event()
+
+        async def slow_run_agent(user_prompt, output_type=None):
+            await release.wait()
+            return Mock(output="summary")
+
+        fake_run_agent = AsyncMock(side_effect=slow_run_agent)
+
+        monkeypatch.setattr(backup_command.slack_routes, "search_channel_by_name", AsyncMock(return_value="C123"))
+        monkeypatch.setattr(backup_command.slack_routes, "get_channel_history", AsyncMock(return_value=messages))
+        monkeypatch.setattr(openai_agent, "_run_agent", fake_run_agent)
+        self.fake_client.files_upload_v2 = AsyncMock(side_effect=RuntimeError("upload failed"))
+
+        await backup_command_callback(
+            self.command, ack=self.fake_ack, respond=self.fake_respond, say=self.fake_say, client=self.fake_client
+        )
+
+        self.fake_respond.assert_awaited_once()
+        assert "upload failed" in self.fake_respond.call_args.args[0]
+
+        # the shielded model run outlives the failed command and lands in the cache for the retry
+        (summary_task,) = openai_agent._inflight_summaries.values()
+        release.set()
+        await summary_task
+
+        assert (await summarize_chat_messages(messages, channel_id="C123")).output == "summary"
+        fake_run_agent.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_cancels_upload(self, monkeypatch):
+        upload_cancelled = asyncio.Event()
+
+        async def slow_upload(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                upload_cancelled.set()
+                raise
+
+        monkeypatch.setattr(backup_command.slack_routes, "search_channel_by_name", AsyncMock(return_value="C123"))
+        monkeypatch.setattr(backup_command.slack_routes, "get_channel_history", AsyncMock(return_value=[{"ts": "1.0"}]))
+        monkeypatch.setattr(backup_command, "summarize_chat_messages", AsyncMock(side_effect=RuntimeError("summary failed")))
+        self.fake_client.files_upload_v2 = slow_upload
+
+        await backup_command_callback(
+            self.command, ack=self.fake_ack, respond=self.fake_respond, say=self.fake_say, client=self.fake_client
+        )
+
+        assert upload_cancelled.is_set()
+        assert "summary failed" in self.fake_respond.call_args.args[0]
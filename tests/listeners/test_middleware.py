@@ -0,0 +1,26 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from slack_bolt.context.async_context import AsyncBoltContext
+
+from src.listeners.middleware import use_shared_slack_client
+from src.services.routes.slack import close_slack_client, get_slack_client
+
+
+class TestUseSharedSlackClient:
+    @pytest.mark.asyncio
+    async def test_listeners_get_the_pooled_client(self):
+        context = AsyncBoltContext(channel_id="C1")
+        fake_next = AsyncMock()
+
+        try:
+            await use_shared_slack_client(context=context, next=fake_next)
+
+            assert context.client is get_slack_client()
+            assert context.client.session is not None
+            # `say` is built from the context's client, so it shares the pool too
+            assert context.say.client is get_slack_client()
+            fake_next.assert_awaited_once()
+
+        finally:
+            await close_slack_client()
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.services.routes.slack import canvas
+from src.services.routes.slack.canvas import get_channel_canvases, update_canvas_title
+
+
+class TestChannelCanvasesCache:
+    def setup_method(self):
+        canvas._channel_canvases_cache.clear()
+        canvas._files_cache.clear()
+
+        self.fake_client = Mock(AsyncWebClient)
+        self.fake_client.token = "xoxb-test"
+        self.fake_client.conversations_info = AsyncMock(
+            return_value={"channel": {"properties": {"tabs": [{"type": "canvas", "data": {"file_id": "F1"}}]}}}
+        )
+        self.fake_client.canvases_edit = AsyncMock(return_value={"ok": True})
+
+        self.title = "News - old"
+        self.fake_get_files = AsyncMock(side_effect=lambda client: [{"id": "F1", "title": self.title}])
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(self, monkeypatch):
+        monkeypatch.setattr(canvas, "get_files", self.fake_get_files)
+
+        await get_channel_canvases(self.fake_client, channel_id="C1")
+        await get_channel_canvases(self.fake_client, channel_id="C1")
+
+        self.fake_client.conversations_info.assert_awaited_once()
+        self.fake_get_files.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returned_list_is_a_copy(self, monkeypatch):
+        monkeypatch.setattr(canvas, "get_files", self.fake_get_files)
+
+        canvases = await get_channel_canvases(self.fake_client, channel_id="C1")
+        canvases[0]["data"]["title"] = "changed"
+        canvases.clear()
+
+        (cached,) = await get_channel_canvases(self.fake_client, channel_id="C1")
+        assert cached["data"]["title"] == "News - old"
+
+    @pytest.mark.asyncio
+    async def test_rename_refreshes_title(self, monkeypatch):
+        monkeypatch.setattr(canvas, "get_files", self.fake_get_files)
+
+        await get_channel_canvases(self.fake_client, channel_id="C1")
+
+        self.title = "News - new"
+        await update_canvas_title(self.fake_client, canvas_id="F1", new_title=self.title)
+
+        (renamed,) = await get_channel_canvases(self.fake_client, channel_id="C1")
+        assert renamed["data"]["title"] == "News - new"
+        assert self.fake_get_files.await_count == 2
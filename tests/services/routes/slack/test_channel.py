@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.services.routes.slack import channel
+from src.services.routes.slack.channel import clear_channel_id_cache, search_channel_by_name
+
+
+def page(names, next_cursor=""):
+    return {
+        "channels": [{"name": name, "id": f"C_{name}"} for name in names],
+        "response_metadata": {"next_cursor": next_cursor},
+    }
+
+
+class TestSearchChannelByName:
+    def setup_method(self):
+        clear_channel_id_cache()
+        channel._channel_id_locks.clear()
+
+        self.fake_client = Mock(AsyncWebClient)
+        self.fake_client.token = "xoxb-test"
+        # cursor -> page, so every crawl starts from the first page like the real api
+        self.pages = {None: page(["general", "random"], "c2"), "c2": page(["news"], "c3"), "c3": page(["support"])}
+
+        async def fake_conversations_list(types=None, cursor=None, limit=None):
+            return self.pages[cursor]
+
+        self.fake_client.conversations_list = AsyncMock(side_effect=fake_conversations_list)
+
+    @pytest.mark.asyncio
+    async def test_stops_paging_once_found(self):
+        assert await search_channel_by_name(self.fake_client, "#random") == "C_random"
+        assert self.fake_client.conversations_list.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hits_served_from_cache(self):
+        assert await search_channel_by_name(self.fake_client, "news") == "C_news"
+        assert self.fake_client.conversations_list.await_count == 2
+
+        # every name seen on the way is cached, not just the one asked for
+        assert await search_channel_by_name(self.fake_client, "general") == "C_general"
+        assert await search_channel_by_name(self.fake_client, "news") == "C_news"
+        assert self.fake_client.conversations_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_crawl_misses_keep_paging(self):
+        assert await search_channel_by_name(self.fake_client, "general") == "C_general"
+
+        # "support" wasn't on the pages read so far, so the partial map can't answer for it
+        assert await search_channel_by_name(self.fake_client, "support") == "C_support"
+        assert self.fake_client.conversations_list.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_misses_are_not_cached(self):
+        assert await search_channel_by_name(self.fake_client, "private") is None
+        assert self.fake_client.conversations_list.await_count == 3
+
+        # the bot is invited to the private channel, so the next crawl lists it
+        self.pages["c3"] = page(["support", "private"])
+
+        assert await search_channel_by_name(self.fake_client, "private") == "C_private"
+        assert self.fake_client.conversations_list.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_refetch(self):
+        await search_channel_by_name(self.fake_client, "general")
+        clear_channel_id_cache()
+        await search_channel_by_name(self.fake_client, "general")
+
+        assert self.fake_client.conversations_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_crawl(self):
+        results = await asyncio.gather(*(search_channel_by_name(self.fake_client, "random") for _ in range(5)))
+
+        assert results == ["C_random"] * 5
+        assert self.fake_client.conversations_list.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_api_error_raises_slack_error(self):
+        self.fake_client.conversations_list.side_effect = Exception("ratelimited")
+
+        with pytest.raises(channel.SlackError):
+            await search_channel_by_name(self.fake_client, "general")
@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.services.routes.slack import files
+from src.services.routes.slack.files import get_files
+
+
+def files_page(page, pages):
+    return {"ok": True, "files": [{"id": f"F{page}"}], "paging": {"count": 1, "total": pages, "page": page, "pages": pages}}
+
+
+class FakeErrorResponse(dict):
+    def __init__(self, error, headers=None):
+        super().__init__(ok=False, error=error)
+        self.headers = headers or {}
+
+
+def slack_api_error(error, headers=None):
+    return SlackApiError(error, FakeErrorResponse(error, headers))
+
+
+class TestGetFiles:
+    def setup_method(self):
+        self.fake_client = Mock(AsyncWebClient)
+        self.fake_sleep = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_follows_page_numbers(self):
+        self.fake_client.files_list = AsyncMock(side_effect=[files_page(1, 3), files_page(2, 3), files_page(3, 3)])
+
+        assert [fi["id"] for fi in await get_files(self.fake_client)] == ["F1", "F2", "F3"]
+        assert [c.kwargs["page"] for c in self.fake_client.files_list.call_args_list] == [1, 2, 3]
+        assert all(c.kwargs["count"] == files.FILES_LIST_PAGE_SIZE for c in self.fake_client.files_list.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_single_page(self):
+        self.fake_client.files_list = AsyncMock(return_value={"ok": True, "files": [], "paging": {"page": 1, "pages": 0}})
+
+        assert await get_files(self.fake_client) == []
+        self.fake_client.files_list.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_page(self, monkeypatch):
+        monkeypatch.setattr(files.asyncio, "sleep", self.fake_sleep)
+        self.fake_client.files_list = AsyncMock(
+            side_effect=[files_page(1, 2), slack_api_error("ratelimited", {"Retry-After": "7"}), files_page(2, 2)]
+        )
+
+        assert [fi["id"] for fi in await get_files(self.fake_client)] == ["F1", "F2"]
+        self.fake_sleep.assert_awaited_once_with(7)
+        assert self.fake_client.files_list.call_args_list[2].kwargs["page"] == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries_with_partial_results(self, monkeypatch):
+        monkeypatch.setattr(files.asyncio, "sleep", self.fake_sleep)
+        self.fake_client.files_list = AsyncMock(
+            side_effect=[files_page(1, 2)] + [slack_api_error("ratelimited")] * (files.FILES_LIST_MAX_RETRIES + 1)
+        )
+
+        assert [fi["id"] for fi in await get_files(self.fake_client)] == ["F1"]
+        assert self.fake_sleep.await_count == files.FILES_LIST_MAX_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_other_errors_return_partial_results(self, monkeypatch):
+        monkeypatch.setattr(files.asyncio, "sleep", self.fake_sleep)
+        self.fake_client.files_list = AsyncMock(side_effect=[files_page(1, 3), slack_api_error("invalid_auth")])
+
+        assert [fi["id"] for fi in await get_files(self.fake_client)] == ["F1"]
+        self.fake_sleep.assert_not_awaited()
@@ -0,0 +1,338 @@
+import asyncio
+from typing import Dict
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import FunctionModel
+
+from src.services import openai_agent, summary_cache
+from src.services.openai_agent import (
+    _compact,
+    _summary_cache_key,
+    get_batch_summaries,
+    summarize_chat_messages,
+    summarize_chat_messages_batch,
+    summarize_chat_messages_batch_api,
+)
+from src.utils.pydantic_agent_generator import PydanticAIDependencies
+
+
+def fake_messages(count, text="x"):
+    return [{"u": f"U{i}", "t": text} for i in range(count)]
+
+
+class TestCompact:
+    def setup_method(self):
+        self.fake_run_agent = AsyncMock(return_value=Mock(output="chunk summary"))
+
+    @pytest.mark.asyncio
+    async def test_short_history_unchanged(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+        messages = fake_messages(10)
+
+        assert await _compact(messages, max_size=10) is messages
+        self.fake_run_agent.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_keeps_head_and_tail(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+        messages = fake_messages(40)
+
+        result = await _compact(messages, max_size=20, keep_first=3, ratio=0.75)
+
+        # 3 pinned, one summary for the short middle, and the last 20 * 0.25 messages verbatim
+        assert result[:3] == messages[:3]
+        assert result[3] == {"u": "summary of earlier messages", "t": "chunk summary"}
+        assert result[4:] == messages[-5:]
+        self.fake_run_agent.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_tail_when_ratio_is_one(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+        messages = fake_messages(40)
+
+        result = await _compact(messages, max_size=20, keep_first=3, ratio=1.0)
+
+        assert result == messages[:3] + [{"u": "summary of earlier messages", "t": "chunk summary"}]
+
+    @pytest.mark.asyncio
+    async def test_splits_middle_by_chunk_size(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+        monkeypatch.setattr(openai_agent, "COMPACT_CHUNK_CHARS", 100)
+
+        # 32 middle messages of 30 chars -> chunks of 4, 4, ... (120 chars each) -> 8 chunks
+        messages = fake_messages(40, text="y" * 30)
+
+        result = await _compact(messages, max_size=20, keep_first=3, ratio=0.75)
+
+        assert self.fake_run_agent.await_count == 8
+        assert len(result) == 3 + 8 + 5
+
+    @pytest.mark.asyncio
+    async def test_trailing_partial_chunk_is_summarized(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+        monkeypatch.setattr(openai_agent, "COMPACT_CHUNK_CHARS", 100)
+
+        # 33 middle messages -> 8 full chunks plus one leftover message
+        messages = fake_messages(41, text="y" * 30)
+
+        await _compact(messages, max_size=20, keep_first=3, ratio=0.75)
+
+        assert self.fake_run_agent.await_count == 9
+        assert self.fake_run_agent.await_args_list[-1].args[0].count('"u"') == 1
+
+
+class TestSummaryCacheKey:
+    def setup_method(self):
+        self.messages = [
+            {"ts": "1700000000.000100", "user": "U1", "text": "hello"},
+            {"ts": "1700000001.000200", "user": "U2", "text": "hi", "edited": {"ts": "1700000005.000000"}},
+        ]
+
+    def test_same_timestamps_same_key(self):
+        # text isn't part of the key, only the timestamps that identify and version each message
+        changed_text = [{**msg, "text": "something else"} for msg in self.messages]
+
+        assert _summary_cache_key(self.messages, "C1") == _summary_cache_key(changed_text, "C1")
+
+    def test_edit_changes_key(self):
+        edited = [self.messages[0], {**self.messages[1], "edited": {"ts": "1700000009.000000"}}]
+
+        assert _summary_cache_key(self.messages, "C1") != _summary_cache_key(edited, "C1")
+
+    def test_first_edit_changes_key(self):
+        edited = [{**self.messages[0], "edited": {"ts": "1700000002.000000"}}, self.messages[1]]
+
+        assert _summary_cache_key(self.messages, "C1") != _summary_cache_key(edited, "C1")
+
+    def test_new_message_changes_key(self):
+        added = self.messages + [{"ts": "1700000010.000300", "user": "U1", "text": "bye"}]
+
+        assert _summary_cache_key(self.messages, "C1") != _summary_cache_key(added, "C1")
+
+    def test_channel_scopes_key(self):
+        assert _summary_cache_key(self.messages, "C1") != _summary_cache_key(self.messages, "C2")
+
+    def test_prompt_version_scopes_key(self, monkeypatch):
+        key = _summary_cache_key(self.messages, "C1")
+        monkeypatch.setattr(openai_agent, "SUMMARY_PROMPT_VERSION", "next")
+
+        assert _summary_cache_key(self.messages, "C1") != key
+
+
+class TestSummarizeChatMessages:
+    def setup_method(self):
+        summary_cache._cache.clear()
+        openai_agent._inflight_summaries.clear()
+
+        self.messages = [{"ts": "1700000000.000100", "user": "U1", "text": "hello"}]
+        self.fake_run_agent = AsyncMock(return_value=Mock(output="summary"))
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_cache(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+
+        first = await summarize_chat_messages(self.messages, channel_id="C1")
+        second = await summarize_chat_messages(list(self.messages), channel_id="C1")
+
+        assert first is second
+        self.fake_run_agent.assert_awaited_once()
+
+
+class TestSummaryCoalescing:
+    def setup_method(self):
+        summary_cache._cache.clear()
+        openai_agent._inflight_summaries.clear()
+
+        self.messages = [{"ts": "1700000000.000100", "user": "U1", "text": "hello"}]
+        self.release = asyncio.Event()
+
+        async def slow_run_agent(user_prompt, output_type=None):
+            await self.release.wait()
+            return Mock(output="summary")
+
+        self.fake_run_agent = AsyncMock(side_effect=slow_run_agent)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_run(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+
+        callers = [asyncio.create_task(summarize_chat_messages(self.messages, channel_id="C1")) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(*callers)
+
+        assert all(result is results[0] for result in results)
+        self.fake_run_agent.assert_awaited_once()
+        assert not openai_agent._inflight_summaries
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_run(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+
+        cancelled = asyncio.create_task(summarize_chat_messages(self.messages, channel_id="C1"))
+        waiting = asyncio.create_task(summarize_chat_messages(self.messages, channel_id="C1"))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        self.release.set()
+
+        assert (await waiting).output == "summary"
+        self.fake_run_agent.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_finishes_and_is_cached_after_every_caller_cancels(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+
+        caller = asyncio.create_task(summarize_chat_messages(self.messages, channel_id="C1"))
+        await asyncio.sleep(0)
+
+        (task,) = openai_agent._inflight_summaries.values()
+        caller.cancel()
+        self.release.set()
+
+        await task
+
+        assert (await summarize_chat_messages(self.messages, channel_id="C1")).output == "summary"
+        self.fake_run_agent.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_not_cached(self, monkeypatch):
+        self.fake_run_agent.side_effect = [RuntimeError("boom"), Mock(output="summary")]
+        monkeypatch.setattr(openai_agent, "_run_agent", self.fake_run_agent)
+
+        with pytest.raises(RuntimeError):
+            await summarize_chat_messages(self.messages, channel_id="C1")
+
+        assert (await summarize_chat_messages(self.messages, channel_id="C1")).output == "summary"
+        assert self.fake_run_agent.await_count == 2
+
+
+class TestCallChatCompletionTool:
+    @pytest.mark.asyncio
+    async def test_tool_error_is_returned_to_the_model(self):
+        fake_openai = Mock()
+        fake_openai.chat.completions.create = AsyncMock(side_effect=TypeError("Missing required arguments"))
+
+        async def call_tool_then_answer(messages, info):
+            if len(messages) == 1:
+                return ModelResponse(parts=[ToolCallPart("call_chat_completion", {"messages": []})])
+            return ModelResponse(parts=[TextPart("done")])
+
+        result = await openai_agent.openai_agent.run(
+            "hi", deps=PydanticAIDependencies(openai=fake_openai), model=FunctionModel(call_tool_then_answer)
+        )
+
+        assert result.output == "done"
+        assert fake_openai.chat.completions.create.call_args.kwargs["model"] == openai_agent.openai_model_name
+
+
+class TestSummarizeChatMessagesBatch:
+    def setup_method(self):
+        summary_cache._cache.clear()
+        openai_agent._inflight_summaries.clear()
+
+        self.batches = [
+            ("C1", [{"ts": "1.0", "user": "U1", "text": "hello"}]),
+            ("C2", [{"ts": "2.0", "user": "U2", "text": "hi"}]),
+            ("C3", []),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_one_structured_call_for_every_channel(self, monkeypatch):
+        fake_run_agent = AsyncMock(return_value=Mock(output={"C1": "one", "C2": "two"}))
+        monkeypatch.setattr(openai_agent, "_run_agent", fake_run_agent)
+
+        # channels without messages are left out
+        assert await summarize_chat_messages_batch(self.batches) == {"C1": "one", "C2": "two"}
+        fake_run_agent.assert_awaited_once()
+        assert fake_run_agent.call_args.kwargs["output_type"] == Dict[str, str]
+
+    @pytest.mark.asyncio
+    async def test_missing_channel_falls_back_to_single_summary(self, monkeypatch):
+        async def fake_run_agent(user_prompt, output_type=None):
+            return Mock(output={"C1": "one"} if output_type else "single")
+
+        monkeypatch.setattr(openai_agent, "_run_agent", fake_run_agent)
+
+        assert await summarize_chat_messages_batch(self.batches) == {"C1": "one", "C2": "single"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_output_falls_back_for_every_channel(self, monkeypatch):
+        async def fake_run_agent(user_prompt, output_type=None):
+            if output_type:
+                raise UnexpectedModelBehavior("Exceeded maximum retries for output validation")
+            return Mock(output="single")
+
+        monkeypatch.setattr(openai_agent, "_run_agent", fake_run_agent)
+
+        assert await summarize_chat_messages_batch(self.batches) == {"C1": "single", "C2": "single"}
+
+    @pytest.mark.asyncio
+    async def test_no_messages(self, monkeypatch):
+        fake_run_agent = AsyncMock()
+        monkeypatch.setattr(openai_agent, "_run_agent", fake_run_agent)
+
+        assert await summarize_chat_messages_batch([("C3", [])]) == {}
+        fake_run_agent.assert_not_awaited()
+
+
+def batch_result(custom_id, content=None, status_code=200):
+    body = {"choices": [{"message": {"content": content}}]} if status_code == 200 else {}
+    return {"custom_id": custom_id, "response": {"status_code": status_code, "body": body}, "error": None}
+
+
+class TestBatchApi:
+    def setup_method(self):
+        self.fake_openai = Mock()
+        self.fake_openai.files.create = AsyncMock(return_value=Mock(id="file-in"))
+        self.fake_openai.batches.create = AsyncMock(return_value=Mock(id="batch-1"))
+        self.fake_openai.batches.retrieve = AsyncMock(
+            side_effect=[Mock(status="in_progress"), Mock(status="completed", output_file_id="file-out")]
+        )
+
+    @pytest.fixture(autouse=True)
+    def fake_dependencies(self, monkeypatch):
+        monkeypatch.setattr(openai_agent, "get_agent_dependencies", lambda: PydanticAIDependencies(openai=self.fake_openai))
+
+    @pytest.mark.asyncio
+    async def test_submits_one_request_per_job(self):
+        jobs = [
+            {"custom_id": "C1", "messages": [{"ts": "1.0", "user": "U1", "text": "hello"}]},
+            {"custom_id": "C2", "messages": [{"ts": "2.0", "user": "U2", "text": "hi"}]},
+        ]
+
+        assert await summarize_chat_messages_batch_api(jobs) == "batch-1"
+
+        filename, content = self.fake_openai.files.create.call_args.kwargs["file"]
+        requests = [orjson.loads(line) for line in content.decode().splitlines()]
+
+        assert [request["custom_id"] for request in requests] == ["C1", "C2"]
+        assert requests[0]["body"]["model"] == openai_agent.openai_model_name
+        assert self.fake_openai.batches.create.call_args.kwargs["input_file_id"] == "file-in"
+
+    @pytest.mark.asyncio
+    async def test_polls_then_reads_successful_results(self):
+        lines = [batch_result("C1", "one"), batch_result("C2", status_code=500), batch_result("C3", "three")]
+        self.fake_openai.files.content = AsyncMock(
+            return_value=Mock(text="\n".join(orjson.dumps(line).decode() for line in lines))
+        )
+
+        assert await get_batch_summaries("batch-1", poll_interval=0) == {"C1": "one", "C3": "three"}
+        assert self.fake_openai.batches.retrieve.await_count == 2
+        self.fake_openai.files.content.assert_awaited_once_with("file-out")
+
+    @pytest.mark.asyncio
+    async def test_batch_without_output(self):
+        self.fake_openai.batches.retrieve = AsyncMock(return_value=Mock(status="expired", output_file_id=None))
+        self.fake_openai.files.content = AsyncMock()
+
+        assert await get_batch_summaries("batch-1") == {}
+        self.fake_openai.files.content.assert_not_awaited()
@@ -0,0 +1,35 @@
+import pytest
+
+from src.services import summary_cache
+
+
+class TestSummaryCache:
+    def setup_method(self):
+        summary_cache._cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self):
+        key = summary_cache.make_key("1", "C1", "ts")
+        await summary_cache.set(key, "summary")
+
+        assert await summary_cache.get(key) == "summary"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped(self):
+        await summary_cache.set("key", "summary", ttl=0)
+
+        assert await summary_cache.get("key") is None
+        assert "key" not in summary_cache._cache
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest_entry(self, monkeypatch):
+        monkeypatch.setattr(summary_cache, "MAX_ENTRIES", 2)
+
+        for key in ("a", "b", "c"):
+            await summary_cache.set(key, key)
+
+        assert await summary_cache.get("a") is None
+        assert await summary_cache.get("c") == "c"
+
+    def test_make_key_separates_parts(self):
+        assert summary_cache.make_key("ab", "c") != summary_cache.make_key("a", "bc")